@@ -0,0 +1,29 @@
+import requests
+
+from requests.adapters import HTTPAdapter
+
+# Seconds to wait for a connection; read timeouts are set by each caller
+CONNECT_TIMEOUT = 5
+
+
+def _create_session() -> requests.Session:
+    """Create the HTTP session shared by the package.
+
+    Connections are kept alive and pooled, so retries and consecutive
+    requests to the same host reuse them instead of opening a new TCP and TLS
+    handshake each time.
+
+    Returns
+    -------
+    requests.Session
+        The HTTP session.
+    """
+    session = requests.Session()
+    # Retries are made by the callers, with exponential backoff
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _create_session()
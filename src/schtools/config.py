@@ -1,5 +1,7 @@
 import tomllib
-from os import environ, makedirs
+from copy import deepcopy
+from functools import lru_cache
+from os import environ, fspath, stat
 from os.path import exists, expanduser, join
 from pathlib import Path
 
@@ -30,23 +32,30 @@ def _get_data_home(data_home=None) -> str:
     default_data_home = join(environ.get("LOCALAPPDATA", "~"), "sch_tools", "datasets")
     if data_home is None:
         data_home = environ.get("SCH_DATAHOME", default_data_home)
-    data_home = Path(expanduser(data_home))
 
-    sch_data_home = data_home / "sch"
-    search_results_data_home = data_home / "search_results"
-    annotation_data_home = data_home / "annotation"
+    # Each caller gets its own copy of the cached paths. fspath keeps the
+    # memoization key a string while rejecting values that are not paths
+    return dict(_create_data_home(fspath(data_home)))
+
+
+@lru_cache(maxsize=32)
+def _create_data_home(data_home: str) -> dict:
+    """Create the data directories, only once per data home in the process."""
+    data_home_path = Path(expanduser(data_home))
+    data_homes = {
+        "sch_data_home": data_home_path / "sch",
+        "search_results_data_home": data_home_path / "search_results",
+        "annotation_data_home": data_home_path / "annotation",
+    }
 
     # Create the directories if they do not exist
-    makedirs(sch_data_home, exist_ok=True)
-    makedirs(search_results_data_home, exist_ok=True)
-    makedirs(annotation_data_home, exist_ok=True)
+    for path in data_homes.values():
+        path.mkdir(parents=True, exist_ok=True)
 
     # Return the data home path
     return {
-        "data_home": str(data_home),
-        "sch_data_home": str(sch_data_home),
-        "search_results_data_home": str(search_results_data_home),
-        "annotation_data_home": str(annotation_data_home),
+        "data_home": str(data_home_path),
+        **{key: str(path) for key, path in data_homes.items()},
     }
 
 def load_api_credentiails(creds_file: str = None) -> dict:
@@ -91,6 +100,13 @@ def load_config_file(config_file: str = None) -> dict:
     -------
     dict
         Dictionary containing the configuration data.
+
+    Notes
+    -----
+    The parsed configuration is cached on the config file path and
+    modification time, so it is only read and validated again when the file
+    changes. The data directories and the credentials are resolved on every
+    call.
     """
 
     if config_file is None:
@@ -98,9 +114,29 @@ def load_config_file(config_file: str = None) -> dict:
 
     if not exists(config_file):
         raise FileNotFoundError(f"Config file not found: {config_file}")
+
+    # Each caller gets its own copy of the cached configuration
+    config = deepcopy(
+        _load_config_file(str(config_file), stat(config_file).st_mtime_ns)
+    )
+
+    config["datasets"] = _get_data_home(config.get("datasets", None))
+
+    if credentials := config.get("credentials", None):
+        creds_file = credentials.get("creds_file", None)
     else:
-        with open(config_file, "rb") as f:
-            config = tomllib.load(f)
+        creds_file = None
+    creds = load_api_credentiails(creds_file)
+    config["credentials"] = creds
+
+    return config
+
+
+@lru_cache(maxsize=8)
+def _load_config_file(config_file: str, mtime_ns: int) -> dict:
+    """Parse and validate the configuration, memoized on the file modification time."""
+    with open(config_file, "rb") as f:
+        config = tomllib.load(f)
 
     # check if the config file has the required keys
     if config.get("cloud", None) is None:
@@ -127,14 +163,4 @@ def load_config_file(config_file: str = None) -> dict:
                     "GET/POST cloud configuration folders not found. Check config file."
                 )
 
-    config["datasets"] = _get_data_home(config.get("datasets", None))
-
-    if credentials := config.get("credentials", None):
-        creds_file = credentials.get("creds_file", None)
-    else:
-        creds_file = None
-    creds = load_api_credentiails(creds_file)
-    config["credentials"] = creds
-
-
     return config
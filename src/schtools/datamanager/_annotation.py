@@ -1,12 +1,28 @@
+import os
 import pandas as pd
+from functools import lru_cache
 from pathlib import Path
 
-def fetch_annotation(annotation_path: str) -> Path:
-    """Fetch the annotation file from the specified path.
+
+@lru_cache(maxsize=4)
+def _load_annotation(
+    annotation_path: Path, mtime_ns: int, size: int, usecols: tuple | None
+) -> pd.DataFrame:
+    """Load the annotation file, memoized on its path, modification time and size."""
+    return pd.read_excel(
+        annotation_path,
+        sheet_name=0,
+        engine="calamine",
+        usecols=None if usecols is None else list(usecols),
+    )
+
+
+def fetch_annotation_path(annotation_path: str | os.PathLike) -> Path:
+    """Fetch the annotation file path, checking that the file exists.
 
     Parameters
     ----------
-    annotation_path : str
+    annotation_path : str or path-like
         The path to the annotation file.
 
     Returns
@@ -14,8 +30,37 @@ def fetch_annotation(annotation_path: str) -> Path:
     Path
         The path to the fetched annotation file.
     """
-    annotation_path = Path(annotation_path).expanduser()
-    if not annotation_path.exists():
-        raise FileNotFoundError(f"Annotation file not found: {annotation_path}")
-    frame = pd.read_excel(annotation_path)
-    return frame
\ No newline at end of file
+    file_path = Path(annotation_path).expanduser()
+    if not file_path.exists():
+        raise FileNotFoundError(f"Annotation file not found: {file_path}")
+    return file_path
+
+
+def load_annotation(
+    annotation_path: str | os.PathLike, usecols: list | None = None
+) -> pd.DataFrame:
+    """Load the annotation file from the specified path.
+
+    Parameters
+    ----------
+    annotation_path : str or path-like
+        The path to the annotation file.
+    usecols : list, default = None
+        Subset of columns to load, by name or position. If `None`, all
+        columns are loaded.
+
+    Returns
+    -------
+    pd.DataFrame
+        The contents of the first sheet of the annotation file.
+    """
+    file_path = fetch_annotation_path(annotation_path)
+    st = file_path.stat()
+    frame = _load_annotation(
+        file_path,
+        st.st_mtime_ns,
+        st.st_size,
+        None if usecols is None else tuple(usecols),
+    )
+    # Each caller gets a deep copy, so changes never reach the memoized frame
+    return frame.copy()
@@ -1,27 +1,290 @@
+import errno
+import json
 import os
+import random
 import shutil
 import time
 import warnings
+import zipfile
 
-from datetime import datetime
-from os import makedirs
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from functools import lru_cache
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from urllib.error import URLError
-from urllib.request import urlretrieve
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import requests
+
+from .._http import CONNECT_TIMEOUT, _SESSION
 
 REMOTE_SCH_DATASET = {
     "url": "https://www.anatel.gov.br/dadosabertos/paineis_de_dados/certificacao_de_produtos",
     "filename": "produtos_certificados.zip",
 }
 
+# Version of the layout of the parsed SCH cache. Bump it whenever the parsed
+# columns or dtypes change, so that a cache written by an older version is
+# rebuilt instead of returning different dtypes than a fresh parse.
+SCH_CACHE_VERSION = 1
+
+# Date columns and their day-first formats
+DATE_FORMATS = {
+    "Data da Homologação": "%d/%m/%Y",
+    "Data do Certificado de Conformidade Técnica": "%d/%m/%Y",
+    "Data de Validade do Certificado": "%d/%m/%Y %H:%M:%S",
+}
+
+# Day-first date formats and the regex replacement reordering them to ISO 8601
+DAYFIRST_DATE_PATTERNS = {
+    "%d/%m/%Y": (r"^(\d{2})/(\d{2})/(\d{4})$", r"\3-\2-\1"),
+    "%d/%m/%Y %H:%M:%S": (
+        r"^(\d{2})/(\d{2})/(\d{4}) (\d{2}:\d{2}:\d{2})$",
+        r"\3-\2-\1 \4",
+    ),
+}
+
+# Text columns, always read as strings so that values looking like numbers
+# (identifiers with leading zeros, codes) are not inferred as numeric
+TEXT_COLUMNS = [
+    "Data da Homologação",
+    "Número de Homologação",
+    "Nome do Solicitante",
+    "CNPJ do Solicitante",
+    "Certificado de Conformidade Técnica",
+    "Data do Certificado de Conformidade Técnica",
+    "Data de Validade do Certificado",
+    "Situação do Certificado",
+    "Situação do Requerimento",
+    "Nome do Fabricante",
+    "Modelo",
+    "Nome Comercial",
+    "Categoria do Produto",
+    "Tipo do Produto",
+    "IC_ANTENA",
+    "IC_ATIVO",
+    "País do Fabricante",
+    "CodUIT",
+    "CodISO",
+]
+
+# Low-cardinality columns stored as categoricals
+CATEGORICAL_COLUMNS = [
+    "Situação do Certificado",
+    "Situação do Requerimento",
+    "Categoria do Produto",
+    "Tipo do Produto",
+    "País do Fabricante",
+    "IC_ANTENA",
+    "IC_ATIVO",
+]
+
+
+def _get_content_length(headers):
+    """Helper function to get the size of a remote file from its headers.
+
+    Parameters
+    ----------
+    headers : Mapping
+        Headers of a HEAD response for the remote file.
+
+    Returns
+    -------
+    content_length : int or None
+        Size of the remote file in bytes, or None if the server does not
+        report it or does not accept byte range requests.
+    """
+    if headers.get("Accept-Ranges", "none").lower() != "bytes":
+        return None
+    content_length = headers.get("Content-Length")
+    return int(content_length) if content_length else None
+
+
+def _parts_generator(size, part_size=10 * 1024**2):
+    """Yield the inclusive (start, end) byte ranges splitting a file of `size` bytes."""
+    for start in range(0, size, part_size):
+        yield start, min(start + part_size, size) - 1
+
+
+def _download_part(url, file_path, start, end, timeout=None):
+    """Helper function to download a byte range of a remote file.
+
+    The range is written at its own offset in `file_path`, which must already
+    exist with the full size of the remote file.
+
+    Returns
+    -------
+    is_partial : bool
+        False if the server ignored the byte range request and answered with
+        the whole file, in which case nothing is written.
+    """
+    headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+    with _SESSION.get(
+        url, headers=headers, stream=True, timeout=(CONNECT_TIMEOUT, timeout)
+    ) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            return False
+        with open(file_path, "r+b") as f:
+            f.seek(start)
+            for chunk in response.iter_content(chunk_size=1024**2):
+                f.write(chunk)
+            if f.tell() != end + 1:
+                raise requests.RequestException(
+                    f"Incomplete byte range {start}-{end} from url: {url}"
+                )
+    return True
+
+
+def _download_stream(url, file_path, timeout=None):
+    """Helper function to download a remote file in a single stream.
+
+    The number of bytes written is checked against the Content-Length of the
+    response, when the server reports it.
+
+    Returns
+    -------
+    headers : Mapping
+        Headers of the response, as sent by the server.
+    """
+    with _SESSION.get(
+        url,
+        headers={"Accept-Encoding": "identity"},
+        stream=True,
+        timeout=(CONNECT_TIMEOUT, timeout),
+    ) as response:
+        response.raise_for_status()
+        with open(file_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=1024**2):
+                f.write(chunk)
+            n_bytes = f.tell()
+
+    expected_size = response.headers.get("Content-Length")
+    if expected_size and n_bytes != int(expected_size):
+        raise requests.RequestException(f"Incomplete download from url: {url}")
+    return response.headers
+
+
+def _download_file(
+    url, file_path, n_connections=4, part_size=10 * 1024**2, timeout=None
+):
+    """Helper function to download a remote file using parallel byte ranges.
+
+    Falls back to a single stream when the server rejects the HEAD request,
+    does not accept byte range requests (even if it advertises them) or the
+    file fits in a single part. A single stream is checked against the
+    Content-Length of its response, and each byte range against the size of
+    the range. A mismatch is raised as a RequestException so that it can be
+    retried.
+
+    All requests go through the shared keep-alive session, so the HEAD
+    request, the parts and any retries reuse the same connections.
+
+    Returns
+    -------
+    headers : Mapping
+        Headers of the remote file, as sent by the server.
+    """
+    try:
+        response = _SESSION.head(
+            url,
+            headers={"Accept-Encoding": "identity"},
+            allow_redirects=True,
+            timeout=(CONNECT_TIMEOUT, timeout),
+        )
+        response.raise_for_status()
+        headers = response.headers
+        size = _get_content_length(headers)
+    except requests.RequestException:
+        # Some servers reject HEAD requests (405, 403, 501), so the size of
+        # the file is unknown and it is downloaded in a single stream
+        size = None
+
+    if size is None or size <= part_size:
+        headers = _download_stream(url, file_path, timeout=timeout)
+    else:
+        # Preallocate the file so that each part can be written at its offset
+        with open(file_path, "r+b") as f:
+            f.truncate(size)
+
+        with ThreadPoolExecutor(max_workers=n_connections) as executor:
+            futures = [
+                executor.submit(_download_part, url, file_path, start, end, timeout)
+                for start, end in _parts_generator(size, part_size)
+            ]
+            try:
+                is_partial = all([future.result() for future in futures])
+            except BaseException:
+                # Do not start the remaining parts, the download is retried
+                executor.shutdown(cancel_futures=True)
+                raise
+
+        if not is_partial:
+            # The server advertised byte ranges but answered with the whole file
+            headers = _download_stream(url, file_path, timeout=timeout)
+
+    return headers
+
+
+def _is_fresh(sch_file_path, timeout=None):
+    """Helper function to check if the local SCH dataset is up to date.
+
+    Revalidate the local file against the remote one with a conditional GET,
+    using the stored ETag and the file modification time. When the server
+    answers 304 (Not Modified), the modification time of the local file is
+    reset so that the grace period starts over.
+
+    Parameters
+    ----------
+    sch_file_path : path-like
+        Path to the local SCH dataset file.
+
+    timeout : float, default=None
+        Number of seconds to wait for the server before giving up.
+
+    Returns
+    -------
+    is_fresh : bool
+        True if the server reports the remote file as not modified.
+    """
+    sch_file_path = Path(sch_file_path)
+    url = REMOTE_SCH_DATASET["url"] + "/" + REMOTE_SCH_DATASET["filename"]
+    headers = {
+        "If-Modified-Since": formatdate(sch_file_path.stat().st_mtime, usegmt=True)
+    }
+    etag_path = sch_file_path.with_suffix(".etag")
+    if etag_path.exists():
+        headers["If-None-Match"] = etag_path.read_text(encoding="utf-8").strip()
+
+    try:
+        # The body is not read: a 200 response is downloaded afterwards
+        with _SESSION.get(
+            url, headers=headers, stream=True, timeout=(CONNECT_TIMEOUT, timeout)
+        ) as response:
+            if response.status_code != 304:
+                return False
+    except requests.RequestException as e:
+        warnings.warn(f"Could not revalidate {sch_file_path}: {e}")
+        return False
+
+    cache_is_valid = _is_sch_cache_valid(sch_file_path)
+    os.utime(sch_file_path)
+    if cache_is_valid:
+        # Keep the cache built from the (unchanged) file valid
+        _write_sch_cache_signature(sch_file_path)
+    return True
+
 
 def _download_sch_database(
     target_dir,
     n_retries=3,
     delay=1,
+    max_delay=60,
+    timeout=60,
+    n_connections=4,
 ):
     """Helper function to download SCH remote dataset.
 
@@ -37,7 +300,18 @@ def _download_sch_database(
         Number of retries when HTTP errors are encountered.
 
     delay : int, default=1
-        Number of seconds between retries.
+        Number of seconds before the first retry. The delay doubles on each
+        subsequent retry, with a small random jitter.
+
+    max_delay : int, default=60
+        Maximum number of seconds between retries.
+
+    timeout : int, default=60
+        Number of seconds to wait for data from the server before giving up
+        on an attempt. Connecting is limited to `CONNECT_TIMEOUT` seconds.
+
+    n_connections : int, default=4
+        Number of parallel connections used to download the file.
 
     Returns
     -------
@@ -45,7 +319,7 @@ def _download_sch_database(
         Full path of the created file.
     """
 
-    makedirs(target_dir, exist_ok=True)
+    Path(target_dir).mkdir(parents=True, exist_ok=True)
     sch_file_path = Path(target_dir) / REMOTE_SCH_DATASET["filename"]
 
     temp_file = NamedTemporaryFile(
@@ -55,12 +329,19 @@ def _download_sch_database(
 
     try:
         temp_file_path = Path(temp_file.name)
+        attempt = 0
         while True:
             try:
                 url = REMOTE_SCH_DATASET["url"] + "/" + REMOTE_SCH_DATASET["filename"]
-                urlretrieve(url, temp_file_path)
+                headers = _download_file(
+                    url, temp_file_path, n_connections=n_connections, timeout=timeout
+                )
+                if not zipfile.is_zipfile(temp_file_path):
+                    raise requests.RequestException(
+                        f"Downloaded file is not a valid zip: {url}"
+                    )
                 break
-            except (URLError, TimeoutError):
+            except requests.RequestException:
                 if n_retries == 0:
                     # If no more retries are left, re-raise the caught exception.
                     raise
@@ -68,19 +349,315 @@ def _download_sch_database(
                     f"Retry downloading from url: {REMOTE_SCH_DATASET['url']}"
                 )
                 n_retries -= 1
-                time.sleep(delay)
+                # Exponential backoff with jitter, capped at max_delay
+                sleep_s = min(max_delay, delay * (2**attempt))
+                time.sleep(sleep_s + random.uniform(0, 0.25 * delay))
+                attempt += 1
     except (Exception, KeyboardInterrupt):
         os.unlink(temp_file.name)
         raise
 
-    # The following renaming is atomic whenever temp_file_path and
-    # file_path are on the same filesystem. This should be the case most of
-    # the time, but we still use shutil.move instead of os.rename in case
-    # they are not.
-    shutil.move(temp_file_path, sch_file_path)
+    # The temporary file is created in target_dir, so this is a single
+    # atomic rename that also overwrites an existing file on Windows.
+    try:
+        os.replace(temp_file_path, sch_file_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # Defensive fallback if target_dir spans filesystems
+        shutil.move(temp_file_path, sch_file_path)
     if not sch_file_path.exists():
         raise OSError("Error downloading SCH Database file.")
 
+    # Keep the ETag to revalidate the file later
+    etag_path = sch_file_path.with_suffix(".etag")
+    if etag := headers.get("ETag"):
+        etag_path.write_text(etag, encoding="utf-8")
+    else:
+        etag_path.unlink(missing_ok=True)
+
+    # Invalidate the cache built from the previous file
+    _clear_sch_cache(sch_file_path)
+    _load_sch_database.cache_clear()
+
+
+def _arrow_to_pandas_dtype(pa_type):
+    """Map an Arrow type to the pandas dtype used for SCH dataset columns.
+
+    Strings map to ``string[pyarrow]`` and other types to their ``ArrowDtype``,
+    so values stay in Arrow buffers. Dictionaries (categoricals) and
+    timestamps return None and keep the default pandas conversion.
+    """
+    if pa.types.is_string(pa_type) or pa.types.is_large_string(pa_type):
+        return pd.StringDtype("pyarrow")
+    if pa.types.is_dictionary(pa_type) or pa.types.is_timestamp(pa_type):
+        return None
+    return pd.ArrowDtype(pa_type)
+
+
+def _table_to_pandas(table):
+    """Convert an Arrow table of the SCH dataset to a DataFrame."""
+    frame = table.to_pandas(types_mapper=_arrow_to_pandas_dtype)
+    if isinstance(frame.index.dtype, pd.ArrowDtype):
+        # Row labels restored from the pandas metadata stay numpy-backed
+        frame.index = frame.index.astype(frame.index.dtype.numpy_dtype)
+    return frame
+
+
+def _get_sch_cache_paths(sch_file_path):
+    """Return the paths of the parsed SCH cache file and its sidecar."""
+    sch_file_path = Path(sch_file_path)
+    return (
+        sch_file_path.with_suffix(".arrow"),
+        sch_file_path.with_suffix(".json"),
+    )
+
+
+def _get_file_signature(file_path):
+    """Return the cache version, mtime and size used to validate cached data."""
+    st = Path(file_path).stat()
+    return {"version": SCH_CACHE_VERSION, "mtime": st.st_mtime, "size": st.st_size}
+
+
+def _is_sch_cache_valid(sch_file_path):
+    """Check if the cache sidecar matches the current SCH dataset file."""
+    cache_path, sidecar_path = _get_sch_cache_paths(sch_file_path)
+    if not (cache_path.exists() and sidecar_path.exists()):
+        return False
+
+    try:
+        with open(sidecar_path, "r", encoding="utf-8") as f:
+            signature = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return signature == _get_file_signature(sch_file_path)
+
+
+def _write_sch_cache_signature(sch_file_path):
+    """Save the signature of the SCH dataset file to the cache sidecar."""
+    _, sidecar_path = _get_sch_cache_paths(sch_file_path)
+    with open(sidecar_path, "w", encoding="utf-8") as f:
+        json.dump(_get_file_signature(sch_file_path), f)
+
+
+def _read_sch_cache(sch_file_path, columns=None):
+    """Helper function to load the parsed SCH dataset from its Arrow cache.
+
+    The cache is memory-mapped, so its pages are loaded on demand and shared
+    through the OS page cache by every process reading it. Arrow-backed
+    columns reference the mapped buffers without copying them.
+
+    Parameters
+    ----------
+    sch_file_path : path-like
+        Path to the SCH dataset file the cache was built from.
+
+    columns : list of str, default=None
+        Subset of columns to load. If None, all columns are loaded.
+
+    Returns
+    -------
+    frame : DataFrame or None
+        The cached SCH dataset, or None if there is no cache or it does not
+        match the current SCH dataset file.
+    """
+    if not _is_sch_cache_valid(sch_file_path):
+        return None
+
+    cache_path, _ = _get_sch_cache_paths(sch_file_path)
+    try:
+        source = pa.memory_map(str(cache_path), "r")
+        table = pa.ipc.open_file(source).read_all()
+        if columns is not None:
+            # Keep the columns holding the row labels of the cached frame
+            index_columns = [
+                col
+                for col in (table.schema.pandas_metadata or {}).get("index_columns", [])
+                if isinstance(col, str)
+            ]
+            table = table.select(index_columns + list(columns))
+        return _table_to_pandas(table)
+    except (OSError, ValueError, KeyError) as e:
+        warnings.warn(f"Ignoring unreadable SCH cache {cache_path}: {e}")
+        return None
+
+
+def _write_sch_cache(frame, sch_file_path):
+    """Helper function to save the parsed SCH dataset as an Arrow IPC cache.
+
+    The cache is written uncompressed next to the SCH dataset file, so that
+    it can be memory-mapped, along with a JSON sidecar holding the
+    modification time and size of the file it was built from.
+    """
+    cache_path, _ = _get_sch_cache_paths(sch_file_path)
+    # A unique name, so concurrent writers never share the temporary file
+    temp_file = NamedTemporaryFile(
+        prefix=cache_path.name + ".part_", dir=cache_path.parent, delete=False
+    )
+    temp_file.close()
+    temp_cache_path = Path(temp_file.name)
+    try:
+        table = pa.Table.from_pandas(frame)
+        with pa.OSFile(str(temp_cache_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        # Processes reading the previous cache keep their own mapping
+        os.replace(temp_cache_path, cache_path)
+        _write_sch_cache_signature(sch_file_path)
+    except (OSError, ValueError) as e:
+        temp_cache_path.unlink(missing_ok=True)
+        warnings.warn(f"Could not write SCH cache {cache_path}: {e}")
+
+
+def _clear_sch_cache(sch_file_path):
+    """Helper function to remove the Arrow cache of the SCH dataset."""
+    cache_path, sidecar_path = _get_sch_cache_paths(sch_file_path)
+    # Removing the sidecar is enough to invalidate the cache
+    sidecar_path.unlink(missing_ok=True)
+    try:
+        cache_path.unlink(missing_ok=True)
+    except OSError:
+        # The cache may still be memory-mapped (e.g. on Windows)
+        pass
+
+
+def _to_datetime_dayfirst(values, date_format):
+    """Helper function to convert day-first date strings to datetime.
+
+    Values matching `date_format` exactly are reordered into ISO 8601 strings
+    with a vectorized replace, which pandas parses much faster than strptime.
+    Any other value falls back to `date_format`, so the result is the same as
+    ``pd.to_datetime(values, format=date_format, errors="coerce")``.
+
+    Parameters
+    ----------
+    values : Series of str
+        The date strings to convert.
+
+    date_format : str
+        One of the day-first formats in `DAYFIRST_DATE_PATTERNS`.
+
+    Returns
+    -------
+    dates : Series of datetime64
+        The converted dates, with NaT for values that could not be parsed.
+    """
+    pattern, repl = DAYFIRST_DATE_PATTERNS[date_format]
+    matched = values.str.fullmatch(pattern).fillna(False).astype(bool)
+    iso_values = values.where(matched).str.replace(pattern, repl, regex=True)
+    dates = pd.to_datetime(iso_values, format="ISO8601", errors="coerce", cache=True)
+
+    fallback = ~matched & values.notna()
+    if fallback.any():
+        dates[fallback] = pd.to_datetime(
+            values[fallback], format=date_format, errors="coerce", cache=True
+        )
+    return dates
+
+
+def _parse_sch_database(sch_file_path, columns=None):
+    """Helper function to parse the SCH dataset file into a DataFrame.
+
+    Parameters
+    ----------
+    sch_file_path : path-like
+        Path to the SCH dataset file.
+
+    columns : list of str, default=None
+        Subset of columns to load. If None, all columns are loaded.
+
+    Returns
+    -------
+    frame : DataFrame
+        The parsed SCH dataset.
+    """
+
+    # Text columns are kept as strings, dates are converted below
+    column_types = {col: pa.string() for col in TEXT_COLUMNS}
+    # The 'Número de Homologação' column is always read, so a subset of
+    # columns is filtered on the same rows as the full dataset
+    include_columns = []
+    if columns is not None:
+        include_columns = list(columns)
+        if "Número de Homologação" not in include_columns:
+            include_columns.append("Número de Homologação")
+    convert_options = pa_csv.ConvertOptions(
+        column_types=column_types,
+        include_columns=include_columns,
+        strings_can_be_null=True,
+    )
+
+    # Parse the CSV while it is decompressed, without extracting it to disk
+    with zipfile.ZipFile(sch_file_path) as z:
+        name = next((n for n in z.namelist() if n.lower().endswith(".csv")), None)
+        if name is None:
+            raise OSError(f"No CSV file found in {sch_file_path}")
+        with z.open(name) as fh:
+            table = pa_csv.read_csv(
+                fh,
+                parse_options=pa_csv.ParseOptions(delimiter=";"),
+                convert_options=convert_options,
+            )
+
+    # remove rows with null values in the 'Número de Homologação' column
+    # before any conversion, keeping their original positions as row labels
+    is_valid = pc.is_valid(table["Número de Homologação"])
+    row_labels = pc.indices_nonzero(is_valid).to_numpy().astype("int64")
+    table = table.filter(is_valid)
+    if columns is not None:
+        table = table.select(list(columns))
+
+    # Dictionary-encode the low-cardinality columns, loaded as categoricals
+    for col in CATEGORICAL_COLUMNS:
+        if col in table.column_names:
+            i = table.column_names.index(col)
+            table = table.set_column(i, col, pc.dictionary_encode(table[col]))
+    frame = _table_to_pandas(table)
+    frame.index = pd.Index(row_labels)
+
+    # Convert the date columns to datetime
+    for col, date_format in DATE_FORMATS.items():
+        if col in frame.columns:
+            frame[col] = _to_datetime_dayfirst(frame[col], date_format)
+
+    return frame
+
+
+@lru_cache(maxsize=4)
+def _load_sch_database(sch_file_path, mtime_ns, size, columns):
+    """Helper function to load the SCH dataset, memoized in the process.
+
+    The modification time and size of the file are not used to load it, but
+    are part of the memoization key, so a changed file is loaded again.
+
+    Parameters
+    ----------
+    sch_file_path : Path
+        Path to the SCH dataset file.
+
+    mtime_ns : int
+        Modification time of the file, in nanoseconds.
+
+    size : int
+        Size of the file, in bytes.
+
+    columns : tuple of str or None
+        Subset of columns to load. If None, all columns are loaded.
+
+    Returns
+    -------
+    frame : DataFrame
+        The SCH dataset.
+    """
+    columns = None if columns is None else list(columns)
+    frame = _read_sch_cache(sch_file_path, columns=columns)
+    if frame is None:
+        frame = _parse_sch_database(sch_file_path, columns=columns)
+        if columns is None:
+            # Only the full frame is cached, so that any projection can be served
+            _write_sch_cache(frame, sch_file_path)
+    return frame
+
 
 def fetch_sch_database(
     data_home,
@@ -89,6 +666,8 @@ def fetch_sch_database(
     force_download=False,
     n_retries=3,
     delay=1.0,
+    timeout=60.0,
+    columns=None,
 ):
     """Load data from SCH dataset
 
@@ -114,7 +693,15 @@ def fetch_sch_database(
         Number of retries when HTTP errors are encountered.
 
     delay : float, default=1.0
-        Number of seconds between retries.
+        Number of seconds before the first retry. The delay doubles on each
+        subsequent retry.
+
+    timeout : float, default=60.0
+        Number of seconds to wait for data from the server before giving up
+        on an attempt.
+
+    columns : list of str, default=None
+        Subset of columns to load. If None, all columns are loaded.
 
     Returns
     -------
@@ -145,27 +732,42 @@ def fetch_sch_database(
     20  CodISO
     ==  ===========================================
 
+    Text columns use the ``string[pyarrow]`` dtype, so their values live in
+    Arrow buffers and the ``.str`` accessor works as usual. Identifiers like
+    'Número de Homologação' and 'CNPJ do Solicitante' are kept as text to
+    preserve leading zeros. Numeric columns use pyarrow-backed dtypes, dates
+    are ``datetime64[ns]``, and the low-cardinality columns (situations,
+    categories, types, country and flags) are categoricals.
     """
 
     sch_file_path = Path(data_home) / REMOTE_SCH_DATASET["filename"]
 
     if sch_file_path.exists():
         # Check if the file is older than the grace period
-        sch_file_ctime = datetime.fromtimestamp(sch_file_path.stat().st_mtime)
-        sch_file_age = datetime.today() - sch_file_ctime
-        if sch_file_age.days > download_grace_period:
-            print(
-                f"File {sch_file_path} is older than {download_grace_period} days. "
-                "Re-downloading the file..."
-            )
-            _download_sch_database(data_home, n_retries=n_retries, delay=delay)
+        sch_file_age_days = (time.time() - sch_file_path.stat().st_mtime) // 86400
+        if sch_file_age_days > download_grace_period:
+            if not force_download and _is_fresh(sch_file_path, timeout=timeout):
+                print(
+                    f"File {sch_file_path} is older than {download_grace_period} "
+                    "days but the remote file has not changed."
+                )
+            else:
+                print(
+                    f"File {sch_file_path} is older than {download_grace_period} "
+                    "days. Re-downloading the file..."
+                )
+                _download_sch_database(
+                    data_home, n_retries=n_retries, delay=delay, timeout=timeout
+                )
         elif force_download:
             # If the file is not older than the grace period and force_download is True, download it
             print(
                 f"File {sch_file_path} is not older than {download_grace_period} days. "
                 "Re-downloading the file (forced)..."
             )
-            _download_sch_database(data_home, n_retries=n_retries, delay=delay)
+            _download_sch_database(
+                data_home, n_retries=n_retries, delay=delay, timeout=timeout
+            )
     else:
         if download_if_missing:
             # If the file does not exist and download_if_missing is True, download it
@@ -173,7 +775,9 @@ def fetch_sch_database(
                 f"File {sch_file_path} does not exist.\nDownloading the file...",
                 end=" ",
             )
-            _download_sch_database(data_home, n_retries=n_retries, delay=delay)
+            _download_sch_database(
+                data_home, n_retries=n_retries, delay=delay, timeout=timeout
+            )
             print("Download complete.")
         else:
             # If the file does not exist and download_if_missing is False, raise an error
@@ -181,29 +785,13 @@ def fetch_sch_database(
                 f"File {sch_file_path} does not exist. Set download_if_missing=True to download it."
             )
 
-    # Read the file into a DataFrame
-    dtype = {
-        "Número de Homologação": str,
-        "CNPJ do Solicitante": str,
-    }
-    frame = pd.read_csv(sch_file_path, sep=";", dtype=dtype)
-
-    # Convert the date columns to datetime
-    frame["Data da Homologação"] = pd.to_datetime(
-        frame["Data da Homologação"], format="%d/%m/%Y", errors="coerce"
-    )
-    frame["Data do Certificado de Conformidade Técnica"] = pd.to_datetime(
-        frame["Data do Certificado de Conformidade Técnica"],
-        format="%d/%m/%Y",
-        errors="coerce",
-    )
-    frame["Data de Validade do Certificado"] = pd.to_datetime(
-        frame["Data de Validade do Certificado"],
-        format="%d/%m/%Y %H:%M:%S",
-        errors="coerce",
+    st = sch_file_path.stat()
+    frame = _load_sch_database(
+        sch_file_path,
+        st.st_mtime_ns,
+        st.st_size,
+        None if columns is None else tuple(columns),
     )
 
-    # remove rows with null values in the 'Número de Homologação' column
-    frame = frame.dropna(subset=["Número de Homologação"])
-
-    return frame
+    # Each caller gets a deep copy, so changes never reach the memoized frame
+    return frame.copy()
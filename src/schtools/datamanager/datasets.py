@@ -1,21 +1,33 @@
 from ._sch import fetch_sch_database
-from ._annotation import fetch_annotation
-from os.path import join
+from ._annotation import fetch_annotation_path, load_annotation
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from pathlib import Path
 
 
 class SCHToolsDatasets:
     """
     A class to manage the download and extraction of schematic datasets.
 
+    The datasets are only loaded when their attribute is first accessed,
+    unless `lazy` is False or `preload` is called.
+
+    Parameters
+    ----------
+    config : dict
+        The configuration returned by `load_config_file`.
+    lazy : bool, default = True
+        If False, load both datasets concurrently on construction.
+
     Attributes
     ----------
-    remote_sch_dataset : dict
-        A dictionary containing the URL and filename of the remote dataset.
-    local_sch_dataset : str
-        The path to the local dataset directory.
+    sch : pd.DataFrame
+        The SCH dataset.
+    annotation : pd.DataFrame
+        The annotation dataset.
     """
 
-    def __init__(self, config):
+    def __init__(self, config, lazy=True):
         # get the path to the data home directory
         # self.data_home = Path(config['datasets']['data_home'])
         # self.sch_data_home = Path(config['datasets']['sch_data_home'])
@@ -24,8 +36,44 @@ class SCHToolsDatasets:
         # self.cloud_annotation_get_folder = Path(config['cloud']['cloud_annotation_get_folder'])
         # self.cloud_annotation_post_folder = Path(config['cloud']['cloud_annotation_post_folder'])
 
-        self.sch = fetch_sch_database(config["datasets"]["sch_data_home"])
-        cloud_annotation_get_file = join(
-            config["cloud"]["cloud_annotation_get_folder"], "Annotation.xlsx"
+        self._sch_data_home = config["datasets"]["sch_data_home"]
+        cloud_annotation_filename = config["cloud"].get(
+            "cloud_annotation_filename", "Annotation.xlsx"
         )
-        self.annotation = fetch_annotation(cloud_annotation_get_file)
+        cloud_annotation_get_file = (
+            Path(config["cloud"]["cloud_annotation_get_folder"]).expanduser()
+            / cloud_annotation_filename
+        ).resolve(strict=False)
+        self._annotation_path = fetch_annotation_path(cloud_annotation_get_file)
+
+        if not lazy:
+            self.preload()
+
+    def preload(self):
+        """Load the SCH and annotation datasets concurrently.
+
+        The loads are independent and mostly spent on I/O and on parsers that
+        release the GIL, so they overlap in two threads.
+
+        Returns
+        -------
+        SCHToolsDatasets
+            The instance itself, with both datasets loaded.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sch = executor.submit(lambda: self.sch)
+            annotation = executor.submit(lambda: self.annotation)
+            # Re-raise any error from the loads
+            sch.result()
+            annotation.result()
+        return self
+
+    @cached_property
+    def sch(self):
+        """The SCH dataset, downloaded if necessary and loaded on first access."""
+        return fetch_sch_database(self._sch_data_home)
+
+    @cached_property
+    def annotation(self):
+        """The annotation dataset, loaded on first access."""
+        return load_annotation(self._annotation_path)
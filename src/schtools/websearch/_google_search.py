@@ -1,10 +1,138 @@
 # -*- coding: utf-8 -*-
+import random
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus
+
+import requests
+
+from .._http import CONNECT_TIMEOUT, _SESSION
 from ._websearch import SCHWebSearch
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) schtools"
+
+
+def _is_retryable(error):
+    """Check if a failed request is worth retrying.
+
+    Connection errors, timeouts, 429 (Too Many Requests) and 5xx responses
+    are transient. Other errors, like 4xx responses, would fail again.
+    """
+    if isinstance(error, requests.HTTPError):
+        status_code = getattr(error.response, "status_code", None)
+        return status_code is not None and (status_code == 429 or status_code >= 500)
+    return isinstance(
+        error,
+        (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        ),
+    )
+
+
 class GoogleSearch(SCHWebSearch):
 
     def __init__(self, config):
         super().__init__(config)
         self.search_url = "https://www.google.com/search?q="
-        self.search_results = []
-        self.search_query = None
\ No newline at end of file
+        self.search_query = None
+
+    def _fetch(self, query, timeout=10, n_retries=3, delay=1.0, max_delay=30.0):
+        """Fetch the results page of a single query.
+
+        Retries on connection errors, timeouts, 429 (Too Many Requests) and
+        5xx responses with capped exponential backoff and jitter. Other HTTP
+        errors are raised at once. Requests go through the shared keep-alive
+        session, so consecutive queries and retries reuse the same connections.
+
+        Parameters
+        ----------
+        query : str
+            The search query.
+
+        timeout : float, default=10
+            Number of seconds to wait for data from the server before giving
+            up on an attempt.
+
+        n_retries : int, default=3
+            Number of retries when HTTP errors are encountered.
+
+        delay : float, default=1.0
+            Number of seconds before the first retry. The delay doubles on
+            each subsequent retry.
+
+        max_delay : float, default=30.0
+            Maximum number of seconds between retries.
+
+        Returns
+        -------
+        content : str
+            The decoded results page.
+        """
+        url = self.search_url + quote_plus(query)
+        attempt = 0
+        while True:
+            try:
+                response = _SESSION.get(
+                    url,
+                    headers={"User-Agent": USER_AGENT},
+                    timeout=(CONNECT_TIMEOUT, timeout),
+                )
+                response.raise_for_status()
+                return response.text
+            except requests.RequestException as e:
+                if attempt == n_retries or not _is_retryable(e):
+                    raise
+                sleep_s = min(max_delay, delay * (2**attempt))
+                time.sleep(sleep_s + random.uniform(0, 0.25 * delay))
+                attempt += 1
+
+    def search_many(self, queries, concurrency=16, timeout=10, n_retries=3, delay=1.0):
+        """Search several queries concurrently.
+
+        Up to `concurrency` queries are in flight at the same time, so the
+        network round trips overlap instead of adding up. Successful results
+        are appended to `search_results`.
+
+        Parameters
+        ----------
+        queries : list of str
+            The search queries.
+
+        concurrency : int, default=16
+            Maximum number of simultaneous requests.
+
+        timeout : float, default=10
+            Number of seconds to wait for data from the server before giving
+            up on an attempt.
+
+        n_retries : int, default=3
+            Number of retries per query when HTTP errors are encountered.
+
+        delay : float, default=1.0
+            Number of seconds before the first retry of a query.
+
+        Returns
+        -------
+        results : list of str or Exception
+            The results page of each query, in the order of `queries`, or the
+            exception raised when a query failed after all its retries.
+        """
+
+        def fetch_safe(query):
+            try:
+                return self._fetch(
+                    query, timeout=timeout, n_retries=n_retries, delay=delay
+                )
+            except requests.RequestException as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(fetch_safe, queries))
+
+        for query, result in zip(queries, results):
+            if not isinstance(result, Exception):
+                self.search_results.append({"query": query, "content": result})
+        return results
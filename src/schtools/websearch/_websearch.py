@@ -1,10 +1,71 @@
 # -*- coding: utf-8 -*-
+import json
+
+from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
+
+
 class SCHWebSearch:
     
     def __init__(self, config):
         self.config = config
         self.search_results_folder = config['datasets'].get("search_results_data_home")
         print(self.search_results_folder)
+        # Bounded buffer of results not yet consumed, the oldest are dropped
+        max_results_cached = config.get("search", {}).get("max_results_cached", 10_000)
+        self.search_results = deque(maxlen=max_results_cached)
 
     def search(self):
         pass
+
+    def iter_results(self) -> Iterator[dict]:
+        """Consume the cached search results, oldest first.
+
+        Yields
+        ------
+        dict
+            A search result, removed from `search_results`.
+        """
+        while self.search_results:
+            yield self.search_results.popleft()
+
+    def save_results(self, filename: str) -> Path:
+        """Append the cached search results to a newline-delimited JSON file.
+
+        The results are consumed from `search_results` as they are written.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file in the search results folder.
+
+        Returns
+        -------
+        Path
+            The path to the results file.
+        """
+        results_path = Path(self.search_results_folder) / filename
+        with open(results_path, "a", encoding="utf-8") as f:
+            for result in self.iter_results():
+                f.write(json.dumps(result, ensure_ascii=False) + "\n")
+        return results_path
+
+    def load_results(self, filename: str) -> Iterator[dict]:
+        """Stream the search results saved by `save_results`, one line at a time.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file in the search results folder.
+
+        Yields
+        ------
+        dict
+            A saved search result.
+        """
+        results_path = Path(self.search_results_folder) / filename
+        with open(results_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
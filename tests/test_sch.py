@@ -0,0 +1,252 @@
+import json
+import os
+import time
+import zipfile
+
+import pandas as pd
+import pytest
+
+from schtools.datamanager import _sch
+
+SCH_COLUMNS = [
+    "Data da Homologação",
+    "Número de Homologação",
+    "Nome do Solicitante",
+    "CNPJ do Solicitante",
+    "Certificado de Conformidade Técnica",
+    "Data do Certificado de Conformidade Técnica",
+    "Data de Validade do Certificado",
+    "Código de Situação do Certificado",
+    "Situação do Certificado",
+    "Código de Situação do Requerimento",
+    "Situação do Requerimento",
+    "Nome do Fabricante",
+    "Modelo",
+    "Nome Comercial",
+    "Categoria do Produto",
+    "Tipo do Produto",
+    "IC_ANTENA",
+    "IC_ATIVO",
+    "País do Fabricante",
+    "CodUIT",
+    "CodISO",
+]
+
+
+def _sch_row(i):
+    """Return a row of the SCH dataset, without homologation number every 4 rows."""
+    number = "" if i % 4 == 0 else f"{i:012d}"
+    return [
+        f"{i % 28 + 1:02d}/01/2020",
+        number,
+        f"Empresa {i % 3}",
+        f"{i:014d}",
+        f"CCT{i}",
+        "31/12/2019",
+        "31/12/2030 00:00:00",
+        "1",
+        "Emitido",
+        "2",
+        "Concluído",
+        "Fabricante",
+        f"{i:05d}",
+        "Nome",
+        "Categoria I",
+        "Celular",
+        "S",
+        "N",
+        "China",
+        "CHN",
+        "CN",
+    ]
+
+
+@pytest.fixture
+def sch_file_path(tmp_path):
+    lines = [";".join(SCH_COLUMNS)] + [";".join(_sch_row(i)) for i in range(20)]
+    file_path = tmp_path / _sch.REMOTE_SCH_DATASET["filename"]
+    with zipfile.ZipFile(file_path, "w") as z:
+        z.writestr("produtos_certificados.csv", "\n".join(lines) + "\n")
+    return file_path
+
+
+def test_cache_hit_equals_fresh_parse(sch_file_path):
+    frame = _sch._parse_sch_database(sch_file_path)
+    _sch._write_sch_cache(frame, sch_file_path)
+
+    cached = _sch._read_sch_cache(sch_file_path)
+    pd.testing.assert_frame_equal(cached, frame)
+    assert cached.equals(frame)
+
+
+def test_cache_from_other_version_is_ignored(sch_file_path, monkeypatch):
+    frame = _sch._parse_sch_database(sch_file_path)
+    _sch._write_sch_cache(frame, sch_file_path)
+    assert _sch._is_sch_cache_valid(sch_file_path)
+
+    monkeypatch.setattr(_sch, "SCH_CACHE_VERSION", _sch.SCH_CACHE_VERSION + 1)
+    assert _sch._read_sch_cache(sch_file_path) is None
+
+
+DAYFIRST_DATES = {
+    "%d/%m/%Y": [
+        "02/01/2020",
+        "2/1/2020",
+        "29/02/2020",
+        "29/02/2021",
+        "31/04/2020",
+        "32/01/2020",
+        "01/13/2020",
+        "2020-01-02",
+        "02/01/20",
+        " 02/01/2020",
+        "",
+        None,
+    ],
+    "%d/%m/%Y %H:%M:%S": [
+        "02/01/2020 03:04:05",
+        "2/1/2020 3:04:05",
+        "02/01/2020 24:00:00",
+        "31/04/2020 00:00:00",
+        "02/01/2020",
+        "02/01/2020 03:04",
+        "",
+        None,
+    ],
+}
+
+
+@pytest.mark.parametrize("date_format", DAYFIRST_DATES)
+@pytest.mark.parametrize("dtype", [pd.StringDtype("pyarrow"), object])
+def test_to_datetime_dayfirst_matches_to_datetime(date_format, dtype):
+    values = pd.Series(DAYFIRST_DATES[date_format], dtype=dtype)
+
+    dates = _sch._to_datetime_dayfirst(values, date_format)
+    expected = pd.to_datetime(values, format=date_format, errors="coerce")
+    pd.testing.assert_series_equal(dates, expected)
+
+
+def test_to_datetime_dayfirst_all_blank():
+    values = pd.Series(["", None, ""], dtype=pd.StringDtype("pyarrow"))
+
+    dates = _sch._to_datetime_dayfirst(values, "%d/%m/%Y")
+    expected = pd.to_datetime(values, format="%d/%m/%Y", errors="coerce")
+    pd.testing.assert_series_equal(dates, expected)
+    assert dates.isna().all()
+
+
+@pytest.fixture
+def fetch(sch_file_path):
+    """Fetch the synthetic SCH dataset without downloading it."""
+
+    def fetch(columns=None):
+        return _sch.fetch_sch_database(
+            sch_file_path.parent, download_if_missing=False, columns=columns
+        )
+
+    _sch._load_sch_database.cache_clear()
+    yield fetch
+    _sch._load_sch_database.cache_clear()
+
+
+def test_fetch_round_trips_through_cache(sch_file_path, fetch, monkeypatch):
+    parsed = fetch()
+    cache_path, _ = _sch._get_sch_cache_paths(sch_file_path)
+    assert cache_path.exists()
+
+    def parse_sch_database(*args, **kwargs):
+        raise AssertionError("the cache should have been used")
+
+    monkeypatch.setattr(_sch, "_parse_sch_database", parse_sch_database)
+    _sch._load_sch_database.cache_clear()
+    cached = fetch()
+
+    assert cached.equals(parsed)
+    pd.testing.assert_series_equal(cached.dtypes, parsed.dtypes)
+    pd.testing.assert_index_equal(cached.index, parsed.index)
+    # Rows without homologation number are dropped, keeping the row labels
+    assert list(cached.index) == [i for i in range(20) if i % 4 != 0]
+
+
+def test_fetch_projection_matches_full_frame(sch_file_path, fetch):
+    columns = ["Modelo", "Código de Situação do Certificado", "IC_ATIVO"]
+    # Without a cache, the projection is parsed from the zip
+    parsed = fetch(columns=columns)
+    assert not _sch._is_sch_cache_valid(sch_file_path)
+
+    full = fetch()
+    pd.testing.assert_frame_equal(parsed, full[columns])
+
+    _sch._load_sch_database.cache_clear()
+    cached = fetch(columns=columns)
+    pd.testing.assert_frame_equal(cached, full[columns])
+
+
+def test_cache_is_invalidated_when_file_changes(sch_file_path, fetch):
+    fetch()
+    assert _sch._is_sch_cache_valid(sch_file_path)
+
+    with zipfile.ZipFile(sch_file_path, "a") as z:
+        z.writestr("LEIAME.txt", "changed")
+    assert not _sch._is_sch_cache_valid(sch_file_path)
+    assert _sch._read_sch_cache(sch_file_path) is None
+
+
+class _FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture
+def remote(monkeypatch):
+    """Answer the conditional GET with the status code set on the fixture."""
+
+    class Remote:
+        def __init__(self):
+            self.status_code = 304
+            self.requests = []
+
+        def get(self, url, headers=None, **kwargs):
+            self.requests.append(headers)
+            return _FakeResponse(self.status_code)
+
+    remote = Remote()
+    monkeypatch.setattr(_sch._SESSION, "get", remote.get)
+    return remote
+
+
+def test_is_fresh_not_modified_touches_file_and_cache(sch_file_path, remote):
+    _sch._write_sch_cache(_sch._parse_sch_database(sch_file_path), sch_file_path)
+    sch_file_path.with_suffix(".etag").write_text('"abc"', encoding="utf-8")
+    old_mtime = time.time() - 200 * 86400
+    os.utime(sch_file_path, (old_mtime, old_mtime))
+    assert not _sch._is_sch_cache_valid(sch_file_path)
+
+    # Validate the cache against the old file, as it was before the check
+    _sch._write_sch_cache_signature(sch_file_path)
+    assert _sch._is_fresh(sch_file_path)
+
+    assert remote.requests[0]["If-None-Match"] == '"abc"'
+    assert "If-Modified-Since" in remote.requests[0]
+    assert sch_file_path.stat().st_mtime > old_mtime + 199 * 86400
+    # The sidecar follows the new modification time, so the cache stays valid
+    assert _sch._is_sch_cache_valid(sch_file_path)
+    _, sidecar_path = _sch._get_sch_cache_paths(sch_file_path)
+    signature = json.loads(sidecar_path.read_text(encoding="utf-8"))
+    assert signature["mtime"] == sch_file_path.stat().st_mtime
+
+
+def test_is_fresh_modified_leaves_file_untouched(sch_file_path, remote):
+    remote.status_code = 200
+    old_mtime = time.time() - 200 * 86400
+    os.utime(sch_file_path, (old_mtime, old_mtime))
+
+    assert not _sch._is_fresh(sch_file_path)
+    assert sch_file_path.stat().st_mtime == old_mtime
+    assert "If-None-Match" not in remote.requests[0]